@@ -0,0 +1,683 @@
+#!/usr/bin/env python3
+"""Rebuild the derived pages of the episode archive.
+
+The scraped episode pages (``episode-*/index.html`` and friends) are the
+source of truth: each one carries its title, publish date and description
+in its ``<head>`` and hero section.  This script scans them and
+regenerates everything that is derived from that metadata:
+
+* the paginated episode index (``index.html``, ``2/`` ... ``N/``)
+* the "newest episode" landing page (``newest/index.html``)
+* ``sitemap.xml``
+
+Usage::
+
+    python build_indexes.py [OUT_DIR]
+
+``OUT_DIR`` defaults to the site root (the directory of this script), so a
+plain run refreshes the checked-in pages in place.
+"""
+
+import gzip
+import json
+import operator
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import blake2b
+from itertools import islice
+from html import unescape
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+SITE = "https://episodes.thestrategists.ca"
+PER_PAGE = 24
+DESC_LIMIT = 177
+
+# Every field we extract sits in the <head> or the hero markup just after
+# it; across the whole archive the last one ends inside the first ~4 KB.
+# Reading a fixed 16 KB prefix keeps plenty of slack while skipping the
+# transcript body, which is the bulk of every page.
+HEAD_BYTES = 16384
+
+# Top-level directories that hold pages but are not episodes.
+SKIP_DIRS = {"assets", "hosts", "topics", "newest"}
+
+# Sidecar cache of parsed metadata so unchanged pages skip read+regex.
+# Bump the version whenever the episode-record shape changes.
+CACHE_PATH = ROOT / ".index_cache.json"
+CACHE_VERSION = 5
+
+# One alternation, one pass.  Each branch wraps the value it extracts in a
+# named group so ``Match.lastgroup`` tells us which field just matched;
+# running ``finditer`` once replaces a handful of independent ``re.search``
+# calls that each re-scanned the whole page.
+# Compiled over bytes: the file prefix never has to be decoded to match,
+# and case-insensitivity on bytes is ASCII-only by definition (the re.A
+# flag added earlier becomes implicit).
+_META_PATTERNS = [
+    rb"<title>(?P<title>[^<]+)</title>",
+    rb'property="og:description"\s+content="(?P<desc_meta>[^"]+)"',
+    rb'property="article:published_time"\s+content="(?P<date>[^"]+)"',
+    rb'<div class="desc">\s*(?P<desc_hero>.*?)\s*</div>',
+]
+COMBINED_RE = re.compile(b"|".join(_META_PATTERNS), re.I | re.S)
+_META_FIELDS = len(_META_PATTERNS)
+
+_TAG_RE = re.compile(rb"<[^>]+>")
+
+# Fallback for JSON-LD blocks that fail to parse as JSON.
+_JSON_DESC_RE = re.compile(rb'"description":\s*"([^"]+)"')
+
+# Pre-bound method objects for the per-episode hot path; saves an
+# attribute resolution per call.
+_FIND_META = COMBINED_RE.finditer
+_STRIP_TAGS = _TAG_RE.sub
+_JSON_DESC_SEARCH = _JSON_DESC_RE.search
+
+# English month names, independent of the process locale.
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+# Same entities the original templates emitted, applied in one C-level
+# pass instead of five sequential str.replace scans.
+_ESC_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&#34;", "'": "&#39;"}
+)
+
+
+def esc(text):
+    """Escape text for HTML the way the original templates did."""
+    return text.translate(_ESC_TABLE)
+
+
+def read_head(path):
+    """Read just the metadata-bearing prefix of a page, as raw bytes."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, HEAD_BYTES)
+    finally:
+        os.close(fd)
+
+
+def extract_meta(html):
+    """Pull the indexable fields out of one page prefix in a single pass.
+
+    Operates on raw bytes; callers decode only the captured values.
+    """
+    out = {}
+    for m in _FIND_META(html):
+        out.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if len(out) == _META_FIELDS:
+            break
+    return out
+
+
+def _write_blob(path, data):
+    """Write a fully rendered page with one os.write on a raw fd."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _jsonld_description(raw):
+    """Read the description out of the JSON-LD block with one json.loads.
+
+    The block is located by literal find over the raw bytes; json.loads
+    accepts bytes directly and handles escaped characters correctly.
+    """
+    start = raw.find(b"application/ld+json")
+    if start == -1:
+        return None
+    start = raw.find(b">", start) + 1
+    end = raw.find(b"</script>", start)
+    try:
+        data = json.loads(raw[start:end])
+    except ValueError:
+        m = _JSON_DESC_SEARCH(raw, start, end)
+        return m.group(1).decode("utf-8") if m else None
+    return data.get("description") or None
+
+
+# One compact record per episode instead of a 10-key dict: a namedtuple
+# is a flat C array of slots, so the sorted list of hundreds of records
+# stays small and column pulls during render go through attrgetter.  It
+# round-trips the JSON cache as a plain array.
+Episode = namedtuple(
+    "Episode",
+    "slug title published desc_html access alt date_h pub_date card_title card_desc",
+)
+
+
+def _parse_one(job):
+    """Worker for load_episodes: turn one (slug, page path) into an Episode."""
+    slug, page = job
+    raw = read_head(page)
+    # Cheap bytes.__contains__ prefilters: hub pages bail out before any
+    # decode or regex work, and the fixed patreon-asset needle never
+    # needed a regex branch in the first place.
+    if b'property="article:published_time"' not in raw:
+        return None  # hub page, not an episode
+    patreon = b"/assets/patreon." in raw
+    # Matching happens on the raw bytes; only the handful of captured
+    # values get decoded below.
+    meta = extract_meta(raw)
+    title = meta["title"].decode("utf-8").strip().removesuffix(" | The Strategists")
+    desc_html = meta.get("desc_hero", b"").decode("utf-8")
+    desc_meta = meta.get("desc_meta")
+    desc = (
+        (desc_meta.decode("utf-8") if desc_meta else None)
+        or _jsonld_description(raw)
+        or _STRIP_TAGS(b"", meta.get("desc_hero", b"")).decode("utf-8")
+    )
+    published = meta["date"].decode("ascii")
+    # Dates are always "YYYY-MM-DDTHH:MM:SSZ"; slicing the fixed offsets
+    # beats the general ISO-8601 parser, and the normalized string itself
+    # sorts identically to the timestamp it encodes.
+    year, month, day = int(published[:4]), int(published[5:7]), int(published[8:10])
+    desc = unescape(" ".join(desc.split()))
+    if len(desc) > DESC_LIMIT:
+        desc = desc[:DESC_LIMIT].rsplit(" ", 1)[0] + "..."
+    access = "patreon" if patreon else "public"
+    # Everything the card template needs is precomputed here so rendering
+    # is a flat substitution with no per-card conditionals or escaping.
+    return Episode(
+        slug=slug,
+        title=unescape(title),
+        published=published,
+        desc_html=desc_html,
+        access=access,
+        alt="Patreon episode" if access == "patreon" else "Public episode",
+        date_h=f"{_MONTHS[month - 1]} {day}, {year}",
+        pub_date=published[:10],
+        card_title=esc(unescape(title)),
+        card_desc=esc(desc),
+    )
+
+
+def load_episodes(root):
+    """Return one Episode record per episode page, newest first.
+
+    Every page is independent, so the read+regex work is farmed out to a
+    process pool; a thread pool would serialize on the GIL while the
+    combined regex chews through each buffer.
+    """
+    with os.scandir(root) as it:
+        candidates = sorted(
+            (entry.name, os.path.join(entry.path, "index.html"))
+            for entry in it
+            if entry.is_dir()
+            and entry.name not in SKIP_DIRS
+            and not entry.name.isdigit()
+            and not entry.name.startswith((".", "_"))
+        )
+    try:
+        cache_file = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        cache = cache_file["entries"] if cache_file.get("version") == CACHE_VERSION else {}
+    except (OSError, ValueError):
+        cache = {}
+    fresh = {}
+    misses = []
+    for slug, path in candidates:
+        st = os.stat(path)
+        key = [st.st_mtime_ns, st.st_size]
+        hit = cache.get(path)
+        if hit is not None and hit["key"] == key:
+            fresh[path] = hit
+        else:
+            misses.append((slug, path, key))
+    if misses:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            parsed = pool.map(
+                _parse_one, [(slug, path) for slug, path, _ in misses], chunksize=16
+            )
+        for (_, path, key), ep in zip(misses, parsed):
+            fresh[path] = {"key": key, "episode": ep}
+    if fresh != cache:
+        CACHE_PATH.write_text(
+            json.dumps({"version": CACHE_VERSION, "entries": fresh}), encoding="utf-8"
+        )
+    # Cache hits come back as plain JSON arrays; _make restores the record
+    # type either way.
+    episodes = [
+        Episode._make(hit["episode"])
+        for hit in fresh.values()
+        if hit["episode"] is not None
+    ]
+    episodes.sort(key=operator.attrgetter("published"), reverse=True)
+    return episodes
+
+
+_CARD_TMPL = '''    <a
+      href="/%s/"
+      class="episode-card %s"
+    >
+      <div class="ep-icon">
+        
+          <img src="/assets/%s.png" alt="%s" loading="lazy">
+        
+      </div>
+
+      <div class="ep-body">
+        <div class="ep-title">%s</div>
+
+        
+          <div class="ep-meta">%s</div>
+        
+
+        
+          <div class="ep-desc">
+            %s
+          </div>
+        
+      </div>
+    </a>'''
+
+
+# One attrgetter call pulls all card columns out of an Episode record at
+# C speed ("access" twice: class and asset name); the %-substituter then
+# walks the template once in C with no dict probes at all.  Both
+# callables are bound once at import.
+_CARD_COLS = operator.attrgetter(
+    "slug", "access", "access", "alt", "card_title", "date_h", "card_desc"
+)
+_CARD_FMT = _CARD_TMPL.__mod__
+
+
+def render_pager(page, pages, cls):
+    if page == 1:
+        newer = ""
+    else:
+        prev_href = "/" if page == 2 else f"/{page - 1}/"
+        newer = f'\n        <a class="chip" href="{prev_href}">← Newer</a>\n      '
+    if page == pages:
+        older = ""
+    else:
+        older = f'\n        <a class="chip" href="/{page + 1}/">Older →</a>\n      '
+    return f'''  <nav class="pager {cls}">
+    <span class="pager-newer">
+      {newer}
+    </span>
+
+    <div class="page-num">
+      Page {page} of {pages}
+    </div>
+
+    <span class="pager-older">
+      {older}
+    </span>
+  </nav>'''
+
+
+# The shell around the card list is identical on every index page; keep
+# it pre-encoded so per-page assembly is a handful of buffer copies
+# instead of re-building (and re-encoding) a multi-KB f-string.
+_PAGE_HEAD = '''<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <meta name="color-scheme" content="light dark" />
+
+  <title>The Strategists</title>
+
+  <meta name="theme-color" content="#0b1020" />
+
+  <link rel="stylesheet" href="/assets/site.css" />
+  <script src="/assets/site.js" defer></script>
+
+  
+</head>
+<body>
+
+  
+  <div class="topbar">
+    <div class="wrap inner">
+      <a class="brand" href="/" aria-label="Back to episodes index">
+        <img
+          src="/assets/wordmark.png"
+          alt="The Strategists"
+          class="brand-logo"
+          loading="eager"
+          decoding="async"
+        />
+      </a>
+
+      <div class="navlinks">
+        <a class="chip" href="/topics/">
+          <strong>Topics</strong>
+        </a>
+
+        
+          <a class="chip" href="/hosts/">
+            <strong>Hosts</strong>
+          </a>
+        
+
+        <a class="chip" href="/"><strong>All episodes</strong></a>
+      </div>
+    </div>
+  </div>
+  
+
+  
+
+<header class="hero">
+  <div class="wrap hero-grid">
+
+    <section class="card hero-main">
+      <h1>The Strategists</h1>
+
+      
+
+      
+        <p class="desc">Canada’s sharpest political insiders break down power, strategy, and the people who actually run the country.</p>
+      
+    </section>
+
+    
+    <aside class="listen-on">
+      <div class="listen-label">Listen to the show</div>
+      <div class="listen-links">
+        
+          <a href="https://podcasts.apple.com/ca/podcast/the-strategists/id1514440943" target="_blank">Apple Podcasts</a>
+        
+        
+          <span>·</span>
+          <a href="https://open.spotify.com/show/7gx7f75pZS38AHWNFj7WGr" target="_blank">Spotify</a>
+        
+        
+          <span>·</span>
+          <a href="https://www.youtube.com/@thestrategists" target="_blank">YouTube</a>
+        
+      </div>
+    </aside>
+    
+
+  </div>
+</header>
+
+<main class="wrap">
+
+  
+'''.encode("utf-8")
+_CARDS_OPEN = b'\n  \n\n  <section class="episode-list">\n    \n'
+_CARDS_CLOSE = b'\n    \n  </section>\n\n  \n'
+_PAGE_TAIL = '''
+  
+
+</main>
+
+
+
+
+<footer class="site-footer">
+  <div class="wrap footer-inner">
+
+    <!-- Social links -->
+    <nav class="footer-social" aria-label="Social links">
+      <a href="https://www.patreon.com/strategistspod" target="_blank" rel="noopener">Patreon</a>
+      <a href="https://www.youtube.com/@strategistspod" target="_blank" rel="noopener">YouTube</a>
+      <a href="https://bsky.app/profile/thestrategists.ca" target="_blank" rel="noopener">Bluesky</a>
+      <a href="https://www.threads.com/@strategistspod" target="_blank" rel="noopener">Threads</a>
+      <a href="https://www.facebook.com/strategistspod" target="_blank" rel="noopener">Facebook</a>      
+      <a href="https://www.instagram.com/strategistspod/" target="_blank" rel="noopener">Instagram</a>
+      <a href="https://www.tiktok.com/@strategistspod" target="_blank" rel="noopener">TikTok</a>
+      <a href="https://www.linkedin.com/company/106712598/" target="_blank" rel="noopener">LinkedIn</a>
+      <a href="https://pinterest.com/strategistspod/" target="_blank" rel="noopener">Pintrest</a>
+    </nav>
+
+    <!-- Postmic -->
+    <div class="footer-postmic">
+      © 2026 The Strategists ·
+      Built with <a href="https://postmic.co" target="_blank" rel="noopener">Postmic</a>
+    </div>
+
+  </div>
+</footer>
+
+</body>
+</html>'''.encode("utf-8")
+
+
+def render_index_page(cards, page, pages):
+    """Render one page of the paginated episode index as UTF-8 bytes."""
+    return b"".join(
+        (
+            _PAGE_HEAD,
+            render_pager(page, pages, "pager-top").encode("utf-8"),
+            _CARDS_OPEN,
+            cards.encode("utf-8"),
+            _CARDS_CLOSE,
+            render_pager(page, pages, "pager-bottom").encode("utf-8"),
+            _PAGE_TAIL,
+        )
+    )
+
+
+def render_newest_page(ep):
+    """Render the newest-episode landing page as UTF-8 bytes."""
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>New Episode Out Now – </title>
+
+  <meta name="robots" content="noindex, nofollow" />
+
+  <link rel="stylesheet" href="/assets/site.css" />
+
+  <style>
+    /* Page-scoped motion only (from newest-oldver) */
+    @keyframes floatIn {{
+      from {{ opacity: 0; transform: translateY(12px) scale(0.98); }}
+      to   {{ opacity: 1; transform: translateY(0) scale(1); }}
+    }}
+
+    .newest-wrap {{
+      min-height: 100vh;
+      display: grid;
+      place-items: center;
+      padding: 24px;
+    }}
+
+    .newest-card {{
+      max-width: 560px;
+      width: 100%;
+      padding: 40px 32px 36px;
+      animation: floatIn 0.6s ease-out;
+    }}
+
+    .badge {{
+      font-size: 13px;
+      letter-spacing: 0.08em;
+      font-weight: 700;
+      color: var(--brand);
+      margin-bottom: 14px;
+    }}
+
+    .buttons {{
+      display: grid;
+      gap: 14px;
+      margin-top: 28px;
+    }}
+
+    .footer-link {{
+      text-align: center;
+      margin-top: 18px;
+      font-size: 13px;
+      color: var(--muted2);
+    }}
+  </style>
+</head>
+
+<body>
+
+  <main class="newest-wrap">
+    <section class="card newest-card">
+
+      <div class="badge">NEW EPISODE OUT NOW</div>
+
+      <h1>{esc(ep.title)}</h1>
+
+      
+        <div class="meta">{ep.pub_date}</div>
+      
+
+      
+        <div class="desc">
+          {ep.desc_html}
+        </div>
+      
+
+      <div class="buttons">
+        <a class="btn primary" href="/{ep.slug}/">
+          ▶️ Listen &amp; Read the Transcript
+        </a>
+
+        <a class="btn" href="https://podcasts.apple.com/ca/podcast/the-strategists/id1514440943" target="_blank">
+          🎧 Listen on Apple Podcasts
+        </a>
+
+        <a class="btn" href="https://open.spotify.com/show/7gx7f75pZS38AHWNFj7WGr" target="_blank">
+          🎧 Listen on Spotify
+        </a>
+
+        <a class="btn" href="https://www.youtube.com/@strategistspod" target="_blank">
+          ▶️ Watch / Listen on YouTube
+        </a>
+      </div>
+
+      <div class="footer-link">
+        <a href="/">Browse all episodes</a>
+      </div>
+
+    </section>
+  </main>
+
+</body>
+</html>'''.encode("utf-8")
+
+
+def render_sitemap(root):
+    """Render sitemap.xml for every directory that holds an index.html.
+
+    Returns the whole document as bytes so the caller can hash-gate the
+    write and derive the gzipped variant; at a few hundred URLs the
+    buffer is tens of KB, not worth streaming.
+    """
+    urls = ["/"]
+    for page in sorted(root.rglob("index.html")):
+        rel = page.parent.relative_to(root)
+        if str(rel) == "." or any(part.startswith(".") for part in rel.parts):
+            continue
+        urls.append(f"/{rel.as_posix()}/")
+    for extra in root.glob("google*.html"):  # Search Console verification
+        urls.append(f"/{extra.name}")
+    urls.sort()
+    parts = [
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    ]
+    parts.extend(
+        f"  <url>\n    <loc>{SITE}{url}</loc>\n  </url>\n".encode("utf-8")
+        for url in urls
+    )
+    parts.append(b"</urlset>")
+    return b"".join(parts)
+
+
+def _load_state(path):
+    """Return the page-hash map from a previous run, or {} if unusable."""
+    try:
+        with open(path, "rb") as fh:
+            state = json.loads(fh.read())
+    except (OSError, ValueError):
+        return {}
+    hashes = state.get("hashes") if isinstance(state, dict) else None
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    out_root = Path(args[0]) if args else ROOT
+    episodes = load_episodes(ROOT)
+    # Cards do not depend on the page they land on, so render each exactly
+    # once and let the pagination loop just join slices.
+    all_cards = [_CARD_FMT(cols) for cols in map(_CARD_COLS, episodes)]
+    pages = (len(episodes) + PER_PAGE - 1) // PER_PAGE
+    # Create any missing output directories in one pass up front; on an
+    # incremental rebuild they all exist already and this costs a single
+    # scandir instead of one mkdir syscall per page.
+    out_root.mkdir(parents=True, exist_ok=True)
+    # Join against a plain string root below: the per-page paths are the
+    # only ones built repeatedly, and os.path.join on str skips a PurePath
+    # allocation per file.
+    root = str(out_root)
+    with os.scandir(root) as it:
+        existing = {entry.name for entry in it if entry.is_dir()}
+    for name in [str(page) for page in range(2, pages + 1)] + ["newest"]:
+        if name not in existing:
+            os.mkdir(os.path.join(root, name))
+    # Hash-gate the page writes: a page whose rendered bytes match the
+    # previous run is left untouched on disk, which keeps mtimes stable
+    # for rsync/CDN invalidation when only a few episodes changed.
+    state_path = out_root / ".build_state.json"
+    old_hashes = _load_state(state_path)
+    hashes = {}
+    futures = []
+
+    # Rendering stays on the main thread; the writes go to a small thread
+    # pool so kernel write-back overlaps with rendering the next page.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+
+        def write_page(rel, data):
+            digest = blake2b(data, digest_size=16).hexdigest()
+            hashes[rel] = digest
+            path = os.path.join(root, rel)
+            if old_hashes.get(rel) == digest and os.path.exists(path):
+                return False
+            futures.append(pool.submit(_write_blob, path, data))
+            return True
+
+        card_iter = iter(all_cards)
+        for page in range(1, pages + 1):
+            # Pages are emitted in order, so islice walks the card list
+            # once without allocating a slice copy per page.
+            cards = "\n    \n".join(islice(card_iter, PER_PAGE))
+            rel = "index.html" if page == 1 else os.path.join(str(page), "index.html")
+            write_page(rel, render_index_page(cards, page, pages))
+        write_page(
+            os.path.join("newest", "index.html"),
+            render_newest_page(episodes[0]),
+        )
+        # The gzipped sitemap (crawlers accept it and it compresses ~10x)
+        # is derived from the same bytes, so it only needs rewriting when
+        # the XML itself changed; mtime=0 keeps the gzip output
+        # deterministic for the hash gate's sake.
+        sitemap = render_sitemap(ROOT)
+        gz_path = os.path.join(root, "sitemap.xml.gz")
+        if write_page("sitemap.xml", sitemap) or not os.path.exists(gz_path):
+            futures.append(
+                pool.submit(
+                    _write_blob, gz_path, gzip.compress(sitemap, 6, mtime=0)
+                )
+            )
+    for future in futures:
+        future.result()
+    if hashes != old_hashes:
+        _write_blob(state_path, json.dumps({"hashes": hashes}).encode("ascii"))
+    print(f"indexed {len(episodes)} episodes across {pages} pages")
+
+
+if __name__ == "__main__":
+    main()